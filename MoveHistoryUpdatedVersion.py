@@ -23,6 +23,7 @@ class PuzzleGraph:
         self.nodes = {}
         self.adjacency_list = {}
         self.solution_path = []
+        self.next_in_solution = {}
 
     def add_node(self, label, row, col, arrow_direction):
         self.nodes[label] = GraphNode(label, row, col, arrow_direction)
@@ -37,6 +38,7 @@ class PuzzleGraph:
 
     def set_solution_path(self, path):
         self.solution_path = path
+        self.next_in_solution = dict(zip(path, path[1:]))
 
 
 # ====================
@@ -71,11 +73,7 @@ class GameState:
         return True
 
     def is_correct_move(self, target):
-        try:
-            idx = self.graph.solution_path.index(self.current_position)
-            return self.graph.solution_path[idx + 1] == target
-        except:
-            return False
+        return self.graph.next_in_solution.get(self.current_position) == target
 
     def make_move(self, target):
         if self.game_over:
@@ -289,12 +287,12 @@ class PuzzleGameGUI:
     def update_display(self):
         for label,node in self.graph.nodes.items():
             btn = self.buttons[label]
-            if node.visited:
+            if label == self.game_state.current_position:
+                btn.config(text=f"{node.visit_order}\n{node.arrow_direction}", bg="yellow")
+            elif node.visited:
                 btn.config(text=f"{node.visit_order}\n{node.arrow_direction}", bg="lightgreen")
             else:
                 btn.config(text=f"{label}\n{node.arrow_direction}", bg="SystemButtonFace")
-            if label == self.game_state.current_position:
-                btn.config(bg="yellow")
 
         self.turn_label.config(text=f"Current Turn: {self.game_state.current_turn}")
         self.human_stats.config(
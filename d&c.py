@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
+import time
 
 # ====================
 # GRAPH IMPLEMENTATION
@@ -23,6 +24,7 @@ class PuzzleGraph:
         self.nodes = {}
         self.adjacency_list = {}
         self.solution_path = []
+        self.next_on_path = {}
 
     def add_node(self, label, row, col, arrow_direction):
         self.nodes[label] = GraphNode(label, row, col, arrow_direction)
@@ -37,6 +39,28 @@ class PuzzleGraph:
 
     def set_solution_path(self, path):
         self.solution_path = path
+        # next_on_path[label] = the label that must follow it in the solution
+        self.next_on_path = {path[i]: path[i + 1] for i in range(len(path) - 1)}
+
+    def reset_state(self):
+        """Clear per-game node state; topology and derived tables are kept"""
+        for node in self.nodes.values():
+            node.visited = False
+            node.visit_order = None
+
+    def build_index(self):
+        """Freeze node labels into indices 0..N-1 once all nodes and edges are added"""
+        self.labels = tuple(sorted(self.nodes))
+        self.label_to_idx = {l: i for i, l in enumerate(self.labels)}
+        self.idx_bits = (len(self.labels) - 1).bit_length()
+        self.neighbors_by_idx = tuple(
+            tuple(self.label_to_idx[n] for n in self.adjacency_list[l])
+            for l in self.labels
+        )
+
+    def edge_key(self, from_label, to_label):
+        """Pack a directed edge into a single int: (from_idx << idx_bits) | to_idx"""
+        return (self.label_to_idx[from_label] << self.idx_bits) | self.label_to_idx[to_label]
 
 
 # ====================
@@ -55,10 +79,13 @@ class GameState:
         self.cpu_correct_moves = 0
         self.cpu_illegal_moves = 0
 
+        # Edges the CPU tried and got wrong, packed with graph.edge_key
         self.cpu_illegal_history = set()
 
         self.graph.nodes['A'].visited = True
         self.graph.nodes['A'].visit_order = 1
+        # Same information as node.visited, as a bitmask over graph.label_to_idx
+        self.visited_mask = 1 << self.graph.label_to_idx['A']
 
         self.game_over = False
         self.winner = None
@@ -71,11 +98,7 @@ class GameState:
         return True
 
     def is_correct_move(self, target):
-        try:
-            idx = self.graph.solution_path.index(self.current_position)
-            return self.graph.solution_path[idx + 1] == target
-        except:
-            return False
+        return self.graph.next_on_path.get(self.current_position) == target
 
     def make_move(self, target):
         if self.game_over:
@@ -89,7 +112,9 @@ class GameState:
                 self.human_illegal_moves += 1
             else:
                 self.cpu_illegal_moves += 1
-                self.cpu_illegal_history.add((self.current_position, target))
+                self.cpu_illegal_history.add(
+                    self.graph.edge_key(self.current_position, target)
+                )
 
             self.switch_turn()
             return False, False
@@ -98,6 +123,7 @@ class GameState:
         node = self.graph.nodes[target]
         node.visited = True
         node.visit_order = self.visit_count
+        self.visited_mask |= 1 << self.graph.label_to_idx[target]
         self.current_position = target
 
         if self.current_turn == 'Human':
@@ -142,35 +168,53 @@ class dncCPU:
     - Divide: consider each candidate neighbor move as a subproblem
     - Conquer: recursively evaluate best outcome from that neighbor (depth-limited)
     - Combine: pick the move with the highest score
+
+    Internally nodes are indices 0..N-1 and a visited set is an int bitmask
+    (bit i set == node i visited).
     """
+    GOAL_SCORE = 10_000
+
     def __init__(self, graph, game_state, depth=6):
         self.graph = graph
         self.game_state = game_state
         self.depth = depth
 
-    # ---------- Heuristic ----------
-    def distance_to_goal(self, label):
-        node = self.graph.nodes[label]
-        goal = self.graph.nodes['P']
-        return abs(node.row - goal.row) + abs(node.col - goal.col)
-
-    # ---------- Candidate generation ----------
-    def build_candidates(self, current, visited_set, illegal_history):
-        neighbors = self.graph.get_neighbors(current)
+        self.goal_idx = graph.label_to_idx['P']
 
-        # Primary: not visited and not previously tried illegal
-        primary = [
-            n for n in neighbors
-            if n not in visited_set and (current, n) not in illegal_history
+        # dist_to_goal[i] = Manhattan distance from node i to the goal
+        goal = graph.nodes['P']
+        self.dist_to_goal = [
+            abs(graph.nodes[l].row - goal.row) + abs(graph.nodes[l].col - goal.col)
+            for l in graph.labels
         ]
 
-        # Fallback: not visited (ignore illegal history)
-        fallback = [n for n in neighbors if n not in visited_set]
+    def reset(self, game_state):
+        """Attach to a new game on the same graph, keeping the precomputed tables"""
+        self.game_state = game_state
 
-        # Fallback: any neighbor
-        candidates = primary or fallback or neighbors
+    # ---------- Candidate generation ----------
+    def build_candidates(self, current, visited_mask, illegal_history):
+        """
+        Single pass over the neighbors:
+        - primary: not visited and not previously tried illegal
+        - fallback: not visited, but tried illegal before
+        - last resort: any neighbor
+        Used for the real (root) move; simulated moves deeper in the search
+        only need the unvisited neighbors and skip this.
+        """
+        neighbors = self.graph.neighbors_by_idx[current]
+        edge_base = current << self.graph.idx_bits
+
+        primary, fallback = [], []
+        for n in neighbors:
+            if visited_mask & (1 << n):
+                continue
+            if illegal_history and (edge_base | n) in illegal_history:
+                fallback.append(n)
+            else:
+                primary.append(n)
 
-        return candidates
+        return primary or fallback or list(neighbors)
 
     # ---------- Scoring ----------
     def score_state(self, position):
@@ -179,97 +223,98 @@ class dncCPU:
         Goal is highest.
         Otherwise prefer closer to goal.
         """
-        if position == 'P':
-            return 10_000
-        return -self.distance_to_goal(position)
+        if position == self.goal_idx:
+            return self.GOAL_SCORE
+        return -self.dist_to_goal[position]
 
     # ---------- Divide & Conquer recursive evaluator ----------
-    def evaluate_best_score(self, current, depth, visited_set, illegal_history):
+    def evaluate_best_score(self, current, depth, visited_mask):
         """
         Returns best achievable score from this state within 'depth' moves,
         assuming the CPU continues to choose best moves.
 
+        current is a node index and visited_mask an int bitmask of visited
+        node indices.
+
         NOTE:
-        - This evaluator uses ONLY legality constraints (visited + illegal-history preference)
-          and heuristic closeness to goal.
+        - This evaluator uses ONLY legality constraints (visited) and heuristic
+          closeness to goal. The illegal-history preference only applies to the
+          real move picked in get_best_move.
         - It does NOT enforce 'correct move' from solution_path (that's checked in GameState.make_move).
           That is okay: CPU is still "trying" to play intelligently, but may be wrong due to hidden path rule.
         """
-        # Base cases
-        if depth == 0 or current == 'P':
-            return self.score_state(current)
+        # Bind hot attributes to locals once per frame
+        score_state = self.score_state
+        goal_score = self.GOAL_SCORE
 
-        candidates = self.build_candidates(current, visited_set, illegal_history)
-        if not candidates:
-            return self.score_state(current)
+        # Base cases
+        if depth == 0 or current == self.goal_idx:
+            return score_state(current)
 
+        recurse = self.evaluate_best_score
         best = -10**9
 
-        # DIVIDE: each candidate leads to a subproblem
-        for nxt in candidates:
-            # If nxt is already visited in this simulated path, skip it
-            if nxt in visited_set:
+        # DIVIDE: each unvisited neighbor leads to a subproblem. Simulated
+        # moves ignore the illegal history, so walk the neighbor index tuple
+        # directly instead of building candidate lists for every frame.
+        for nxt in self.graph.neighbors_by_idx[current]:
+            bit = 1 << nxt
+            if visited_mask & bit:
                 continue
 
             # CONQUER: solve subproblem recursively
-            new_visited = set(visited_set)
-            new_visited.add(nxt)
-
-            sub_score = self.evaluate_best_score(
-                nxt,
-                depth - 1,
-                new_visited,
-                illegal_history
-            )
+            sub_score = recurse(nxt, depth - 1, visited_mask | bit)
 
             # COMBINE: take the maximum score
             if sub_score > best:
                 best = sub_score
+                # Nothing scores above the goal, so the remaining siblings
+                # cannot improve on it
+                if best >= goal_score:
+                    break
 
-        # If everything was blocked
+        # If everything was blocked (or the node has no neighbors)
         if best == -10**9:
-            return self.score_state(current)
+            best = score_state(current)
 
         return best
 
     # ---------- Final decision ----------
     def get_best_move(self):
-        current = self.game_state.current_position
+        current = self.graph.label_to_idx[self.game_state.current_position]
         illegal_history = self.game_state.cpu_illegal_history
 
-        # Start visited set from REAL visited nodes
-        visited_set = {lbl for lbl, node in self.graph.nodes.items() if node.visited}
+        # Start from the REAL visited nodes
+        visited_mask = self.game_state.visited_mask
 
-        candidates = self.build_candidates(current, visited_set, illegal_history)
+        candidates = self.build_candidates(current, visited_mask, illegal_history)
         if not candidates:
             # last resort: choose any node (will likely be illegal, but avoids crash)
             return random.choice(list(self.graph.nodes.keys()))
 
+        evaluate_best_score = self.evaluate_best_score
+        goal_score = self.GOAL_SCORE
+
         best_move = candidates[0]
         best_score = -10**9
 
         # DIVIDE: treat each candidate as a separate subproblem
         for move in candidates:
-            if move in visited_set:
+            bit = 1 << move
+            if visited_mask & bit:
                 continue
 
-            new_visited = set(visited_set)
-            new_visited.add(move)
-
             # CONQUER: evaluate outcome from this move
-            sc = self.evaluate_best_score(
-                move,
-                self.depth - 1,
-                new_visited,
-                illegal_history
-            )
+            sc = evaluate_best_score(move, self.depth - 1, visited_mask | bit)
 
             # COMBINE: choose move with best score
             if sc > best_score:
                 best_score = sc
                 best_move = move
+                if best_score >= goal_score:
+                    break
 
-        return best_move
+        return self.graph.labels[best_move]
 
 
 # ====================
@@ -308,19 +353,45 @@ class PuzzleGameGUI:
         self.cpu_player = dncCPU(self.graph, self.game_state, depth=6)
 
         self.buttons = {}
+        # Cells whose button needs reconfiguring on the next update_display
+        self._dirty = set(self.graph.nodes)
         self.glitch_chars = ['█', '▓', '▒', '░', '▀', '▄', '▌', '▐', '■', '□', '▪', '▫', '◘', '◙']
         self.glitch_colors = [self.COLORS['cyan'], self.COLORS['magenta'], self.COLORS['yellow'], 
                              self.COLORS['green'], self.COLORS['purple'], self.COLORS['orange']]
+        self.subtitle_variants = (
+            "< NEURAL_PATH_SOLVER v2.1 >",
+            "< N3UR4L_P4TH_S0LV3R v2.1 >",
+            "< █EURAL_PATH_SOLVER v2.1 >",
+            "< NEURAL_PATH_S░LVER v2.1 >",
+            "< NEURAL▓PATH_SOLVER v2.1 >",
+            "< NEU░AL_PATH_SOLVER v2.1 >"
+        )
+        # Animation frames cycle through the tables above with counters
+        # instead of calling random.choice on every frame
+        self._glitch_i = 0
+        self._border_i = 0
+
+        # Flash animations as precomputed (delay_ms, config) plans;
+        # a None config ends the animation and restores the cell
+        self._flash_illegal_plan = self.build_flash_illegal_plan()
+        self._flash_cpu_plan = self.build_flash_cpu_plan()
         
         # Timer variables
         self.timer_seconds = 0
         self.timer_max = 15
         self.timer_id = None
+        self.timer_tick_ms = 250
+
+        # Animation schedule: one master tick drives every animation
+        self.anim_tick_ms = 1500
+        self.anim_intervals = {'glitch': 1500, 'borders': 3000}
+        self._anim_due = {name: 0 for name in self.anim_intervals}
+        self.turn_start = time.monotonic()
+        self._last_displayed = None
         
         self.create_gui()
         self.update_display()
-        self.animate_glitch()
-        self.animate_borders()
+        self.animate_tick()
         self.start_timer()
 
     def create_fixed_puzzle(self):
@@ -346,6 +417,7 @@ class PuzzleGameGUI:
         graph.set_solution_path(
             ['A','K','F','H','G','E','B','L','D','C','I','J','M','N','O','P']
         )
+        graph.build_index()
         return graph
 
     def create_gui(self):
@@ -602,62 +674,78 @@ class PuzzleGameGUI:
         )
         self.cpu_stats.pack(anchor="w", pady=3)
 
+    def animate_tick(self):
+        """
+        Single animation clock: runs each animation when it is due, and does
+        no widget work at all while the window is minimized.
+        """
+        if self.root.state() == 'iconic':
+            self.root.after(self.anim_tick_ms, self.animate_tick)
+            return
+
+        for name, interval in self.anim_intervals.items():
+            self._anim_due[name] -= self.anim_tick_ms
+            if self._anim_due[name] <= 0:
+                self._anim_due[name] = interval
+                if name == 'glitch':
+                    self.animate_glitch()
+                else:
+                    self.animate_borders()
+
+        self.root.after(self.anim_tick_ms, self.animate_tick)
+
     def animate_glitch(self):
         """Subtle glitch animation on subtitle"""
-        glitch_text = random.choice([
-            "< NEURAL_PATH_SOLVER v2.1 >",
-            "< N3UR4L_P4TH_S0LV3R v2.1 >",
-            "< █EURAL_PATH_SOLVER v2.1 >",
-            "< NEURAL_PATH_S░LVER v2.1 >",
-            "< NEURAL▓PATH_SOLVER v2.1 >",
-            "< NEU░AL_PATH_SOLVER v2.1 >"
-        ])
+        glitch_text = self.subtitle_variants[self._glitch_i % len(self.subtitle_variants)]
+        self._glitch_i += 1
         self.subtitle_label.config(text=glitch_text)
-        self.root.after(1500, self.animate_glitch)
 
     def animate_borders(self):
-        """Random glitch effect on grid borders"""
+        """Glitch effect on grid borders, cycling through glitch_colors"""
         if hasattr(self, 'grid_outer'):
-            color = random.choice(self.glitch_colors)
+            color = self.glitch_colors[self._border_i % len(self.glitch_colors)]
+            self._border_i += 1
             self.grid_outer.config(bg=color)
-        self.root.after(3000, self.animate_borders)
 
     def start_timer(self):
         """Start the turn timer"""
         self.timer_seconds = 0
+        self.turn_start = time.monotonic()
+        self._last_displayed = None
         self.update_timer()
 
     def update_timer(self):
-        """Update timer every second"""
+        """
+        Update the timer from a monotonic clock. Ticks every timer_tick_ms
+        for responsiveness, but only touches the label when the shown value
+        changes.
+        """
         if self.game_state.game_over:
             return
         
         if self.game_state.current_turn == 'Human':
-            self.timer_seconds += 1
+            self.timer_seconds = int(time.monotonic() - self.turn_start)
             
             # Update timer display
             remaining = self.timer_max - self.timer_seconds
-            if remaining <= 5:
+            if remaining != self._last_displayed:
+                self._last_displayed = remaining
                 # Warning color when time is running out
                 self.timer_label.config(
                     text=f"⏱ TIME: {remaining}s",
-                    fg=self.COLORS['red']
-                )
-            else:
-                self.timer_label.config(
-                    text=f"⏱ TIME: {remaining}s",
-                    fg=self.COLORS['yellow']
+                    fg=self.COLORS['red'] if remaining <= 5 else self.COLORS['yellow']
                 )
             
             # Check if time expired
             if self.timer_seconds >= self.timer_max:
                 self.on_timeout()
                 return
-        else:
+        elif self._last_displayed != 'CPU':
             # CPU turn - show no timer
+            self._last_displayed = 'CPU'
             self.timer_label.config(text="⏱ CPU THINKING...")
         
-        self.timer_id = self.root.after(1000, self.update_timer)
+        self.timer_id = self.root.after(self.timer_tick_ms, self.update_timer)
 
     def reset_timer(self):
         """Reset timer for new turn"""
@@ -682,64 +770,72 @@ class PuzzleGameGUI:
         self.history.config(state="disabled")
         self.history.see(tk.END)
 
-    def flash_illegal(self, label):
-        """Enhanced glitch effect for illegal moves"""
+    def build_flash_illegal_plan(self, frames=5, frame_ms=120):
+        """Glitch frames for illegal moves: red cell cycling block characters"""
+        plan = []
+        for i in range(frames):
+            glitch = self.glitch_chars[i % len(self.glitch_chars)]
+            plan.append((i * frame_ms, {
+                'bg': self.COLORS['red'],
+                'text': f"{glitch}\n{glitch}",
+                'fg': self.COLORS['yellow'],
+                'font': ('Courier New', 24, 'bold'),
+                'highlightthickness': 7,
+                'highlightbackground': self.COLORS['red']
+            }))
+        plan.append((frames * frame_ms, None))
+        return plan
+
+    def build_flash_cpu_plan(self, frames=8, frame_ms=200):
+        """Pulse frames for CPU moves, alternating bright and dim"""
+        bright = {
+            'bg': self.COLORS['cpu_highlight'],
+            'fg': self.COLORS['yellow'],
+            'highlightbackground': self.COLORS['yellow'],
+            'highlightthickness': 7,
+            'font': ('Courier New', 24, 'bold')
+        }
+        dim = {
+            'bg': self.COLORS['purple'],
+            'fg': self.COLORS['text'],
+            'highlightbackground': self.COLORS['purple'],
+            'highlightthickness': 7,
+            'font': ('Courier New', 24, 'bold')
+        }
+        plan = [(i * frame_ms, dim if i % 2 else bright) for i in range(frames)]
+        plan.append((frames * frame_ms, None))
+        return plan
+
+    def play_flash(self, label, plan):
+        """Schedule every frame of a flash plan up front"""
         btn = self.buttons[label]
-        original_text = btn.cget("text")
-        
-        # Glitch animation sequence
-        def glitch_frame(count):
-            if count > 0:
-                glitch = random.choice(self.glitch_chars)
-                btn.config(
-                    bg=self.COLORS['red'],
-                    text=f"{glitch}\n{glitch}",
-                    fg=self.COLORS['yellow'],
-                    font=('Courier New', 24, 'bold'),
-                    highlightthickness=7,
-                    highlightbackground=self.COLORS['red']
-                )
-                self.root.after(120, lambda: glitch_frame(count - 1))
+        for delay, cfg in plan:
+            if cfg is None:
+                self.root.after(delay, self.end_flash, label)
             else:
-                self.update_display()
-        
-        glitch_frame(5)
+                self.root.after(delay, btn.config, cfg)
+
+    def end_flash(self, label):
+        self._dirty.add(label)
+        self.update_display()
+
+    def flash_illegal(self, label):
+        """Enhanced glitch effect for illegal moves"""
+        self.play_flash(label, self._flash_illegal_plan)
 
     def flash_cpu_move(self, label):
-        """Ultra bright pulsing animation for CPU moves"""
-        btn = self.buttons[label]
-        
-        def pulse_frame(count, bright):
-            if count > 0:
-                if bright:
-                    btn.config(
-                        bg=self.COLORS['cpu_highlight'],
-                        fg=self.COLORS['yellow'],
-                        highlightbackground=self.COLORS['yellow'],
-                        highlightthickness=7,
-                        font=('Courier New', 24, 'bold')
-                    )
-                else:
-                    btn.config(
-                        bg=self.COLORS['purple'],
-                        fg=self.COLORS['text'],
-                        highlightbackground=self.COLORS['purple'],
-                        highlightthickness=7,
-                        font=('Courier New', 24, 'bold')
-                    )
-                self.root.after(200, lambda: pulse_frame(count - 1, not bright))
-            else:
-                self.update_display()
-        
-        pulse_frame(8, True)  # 8 pulses = 1.6 seconds of animation
+        """Ultra bright pulsing animation for CPU moves (8 pulses = 1.6 seconds)"""
+        self.play_flash(label, self._flash_cpu_plan)
 
     def on_cell_click(self, label):
         if self.game_state.current_turn != 'Human' or self.game_state.game_over:
             return
 
+        old_pos = self.game_state.current_position
         success,_ = self.game_state.make_move(label)
 
         if success:
+            self._dirty.update((old_pos, label))
             self.log(f"HUMAN → {label} [OK]", "legal")
         else:
             self.log(f"HUMAN → {label} [ERROR]", "illegal")
@@ -758,9 +854,11 @@ class PuzzleGameGUI:
             return
 
         move = self.cpu_player.get_best_move()
+        old_pos = self.game_state.current_position
         success,_ = self.game_state.make_move(move)
 
         if success:
+            self._dirty.update((old_pos, move))
             self.log(f"CPU → {move} [OK]", "legal")
             self.flash_cpu_move(move)
         else:
@@ -773,35 +871,35 @@ class PuzzleGameGUI:
             self.root.after(1000, self.show_winner)
 
     def update_display(self):
-        for label, node in self.graph.nodes.items():
-            btn = self.buttons[label]
+        colors = self.COLORS
+        current_pos = self.game_state.current_position
+        cell_font = ('Courier New', 20, 'bold')
+
+        # Only cells that changed since the last refresh are reconfigured,
+        # each with a single config call
+        for label in self._dirty:
+            node = self.graph.nodes[label]
             if node.visited:
-                btn.config(
-                    text=f"[{node.visit_order}]\n{node.arrow_direction}",
-                    bg=self.COLORS['grid_visited'],
-                    fg=self.COLORS['green'],
-                    highlightbackground=self.COLORS['green'],
-                    highlightthickness=3,
-                    font=('Courier New', 20, 'bold')
-                )
+                text = f"[{node.visit_order}]\n{node.arrow_direction}"
             else:
-                btn.config(
-                    text=f"{label}\n{node.arrow_direction}",
-                    bg=self.COLORS['grid_cell'],
-                    fg=self.COLORS['cyan'],
-                    highlightbackground=self.COLORS['purple'],
-                    highlightthickness=4,
-                    font=('Courier New', 20, 'bold')
-                )
-            
-            if label == self.game_state.current_position:
-                btn.config(
-                    bg=self.COLORS['grid_current'],
-                    fg=self.COLORS['yellow'],
-                    highlightbackground=self.COLORS['yellow'],
-                    highlightthickness=6,
-                    font=('Courier New', 20, 'bold')
-                )
+                text = f"{label}\n{node.arrow_direction}"
+
+            if label == current_pos:
+                bg, fg, border, thickness = colors['grid_current'], colors['yellow'], colors['yellow'], 6
+            elif node.visited:
+                bg, fg, border, thickness = colors['grid_visited'], colors['green'], colors['green'], 3
+            else:
+                bg, fg, border, thickness = colors['grid_cell'], colors['cyan'], colors['purple'], 4
+
+            self.buttons[label].config(
+                text=text,
+                bg=bg,
+                fg=fg,
+                highlightbackground=border,
+                highlightthickness=thickness,
+                font=cell_font
+            )
+        self._dirty.clear()
 
         turn_color = self.COLORS['cyan'] if self.game_state.current_turn == 'Human' else self.COLORS['magenta']
         self.turn_label.config(
@@ -857,10 +955,11 @@ class PuzzleGameGUI:
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
         
-        # Create fresh graph and game state
-        self.graph = self.create_fixed_puzzle()
+        # Reuse the fixed puzzle graph; only its per-game state is cleared
+        self.graph.reset_state()
         self.game_state = GameState(self.graph)
-        self.cpu_player = dncCPU(self.graph, self.game_state, depth=6)
+        self.cpu_player.reset(self.game_state)
+        self._dirty = set(self.graph.nodes)
         
         # Clear the history log
         self.history.config(state="normal")
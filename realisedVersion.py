@@ -21,6 +21,7 @@ class PuzzleGraph:
         self.nodes = {}
         self.adjacency_list = {}
         self.solution_path = []
+        self.next_in_solution = {}
 
     def add_node(self, label, row, col, arrow):
         self.nodes[label] = GraphNode(label, row, col, arrow)
@@ -34,6 +35,7 @@ class PuzzleGraph:
 
     def set_solution_path(self, path):
         self.solution_path = path
+        self.next_in_solution = dict(zip(path, path[1:]))
 
 
 # ============================================================
@@ -68,11 +70,7 @@ class GameState:
         )
 
     def is_correct_move(self, target):
-        try:
-            idx = self.graph.solution_path.index(self.current_position)
-            return self.graph.solution_path[idx + 1] == target
-        except:
-            return False
+        return self.graph.next_in_solution.get(self.current_position) == target
 
     def make_move(self, target):
         if self.game_over:
@@ -287,16 +285,16 @@ class PuzzleGameGUI:
     def update_display(self):
         for label, node in self.graph.nodes.items():
             b = self.buttons[label]
-            if node.visited:
+            if label == self.state.current_position:
+                b.config(text=f"{node.visit_order}\n{node.arrow_direction}",
+                         bg="yellow")
+            elif node.visited:
                 b.config(text=f"{node.visit_order}\n{node.arrow_direction}",
                          bg="lightgreen")
             else:
                 b.config(text=f"{label}\n{node.arrow_direction}",
                          bg="SystemButtonFace")
 
-            if label == self.state.current_position:
-                b.config(bg="yellow")
-
         self.turn_label.config(
             text=f"NOW {self.state.current_turn.upper()} TURN"
         )
@@ -1,46 +1,190 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # ====================
 # GRAPH IMPLEMENTATION
 # ====================
 
-class GraphNode:
-    """Represents a single grid cell in the puzzle"""
-    def __init__(self, label, row, col, arrow_direction):
-        self.label = label  # 'A', 'B', 'C', etc.
-        self.row = row
-        self.col = col
-        self.arrow_direction = arrow_direction  # 'up', 'down', 'left', 'right'
-        self.visited = False
-        self.visit_order = None  # Will be 1, 2, 3... when visited
-
 class PuzzleGraph:
-    """Graph representation using adjacency list"""
+    """
+    Graph representation using parallel arrays indexed by cell (0..15)
+    Labels are only used at the GUI boundary via labels / label_to_idx
+    """
+    __slots__ = ('labels', 'label_to_idx', 'start', 'goal', 'rows', 'cols', 'arrows',
+                 'adjacency_list', 'adjacency_set', 'neighbors_by_distance',
+                 'distance_to_goal', 'solution_path', 'next_in_solution')
+    
     def __init__(self):
-        self.nodes = {}  # Dictionary: label -> GraphNode
-        self.adjacency_list = {}  # Dictionary: label -> [neighbor_labels]
+        self.labels = []  # List: idx -> label ('A', 'B', 'C', etc.), a string once finalized
+        self.label_to_idx = {}  # Dictionary: label -> idx
+        self.start = -1  # idx of 'A', set by finalize()
+        self.goal = -1  # idx of 'P', set by finalize()
+        self.rows = bytearray()
+        self.cols = bytearray()
+        self.arrows = []  # List: idx -> arrow character
+        self.adjacency_list = []  # List: idx -> [neighbor idx]
+        self.adjacency_set = []  # List: idx -> frozenset(neighbor idx), set by finalize()
+        self.distance_to_goal = []  # List: idx -> Manhattan distance to 'P', set by finalize()
+        self.neighbors_by_distance = []  # List: idx -> neighbors closest to 'P' first, set by finalize()
         self.solution_path = []  # Correct sequence of moves
+        self.next_in_solution = []  # List: idx -> next idx on the solution path, -1 at the end
         
     def add_node(self, label, row, col, arrow_direction):
         """Add a node (grid cell) to the graph"""
-        node = GraphNode(label, row, col, arrow_direction)
-        self.nodes[label] = node
-        self.adjacency_list[label] = []
+        self.label_to_idx[label] = len(self.labels)
+        self.labels.append(label)
+        self.rows.append(row)
+        self.cols.append(col)
+        self.arrows.append(arrow_direction)
+        self.adjacency_list.append([])
         
     def add_edge(self, from_label, to_label):
         """Add directed edge based on arrow direction"""
-        if from_label in self.adjacency_list:
-            self.adjacency_list[from_label].append(to_label)
+        if from_label in self.label_to_idx:
+            self.adjacency_list[self.label_to_idx[from_label]].append(self.label_to_idx[to_label])
+    
+    def finalize(self):
+        """
+        Build neighbor sets and goal distances, then freeze every table
+        Called once all nodes, edges and the solution path are set
+        """
+        self.adjacency_set = tuple(frozenset(v) for v in self.adjacency_list)
+        
+        self.start = self.label_to_idx['A']
+        self.goal = goal = self.label_to_idx['P']
+        self.distance_to_goal = tuple(
+            abs(self.rows[i] - self.rows[goal]) + abs(self.cols[i] - self.cols[goal])
+            for i in range(len(self.labels))
+        )
+        
+        # Distances are static, so the greedy order of each cell's
+        # neighbors is too (ties go to the lower idx)
+        self.neighbors_by_distance = tuple(
+            tuple(sorted(v, key=lambda n: (self.distance_to_goal[n], n)))
+            for v in self.adjacency_list
+        )
+        
+        # Labels are single characters, so one 16-char string serves as the idx -> label table
+        self.labels = ''.join(self.labels)
+        self.rows = bytes(self.rows)
+        self.cols = bytes(self.cols)
+        self.arrows = tuple(self.arrows)
+        self.adjacency_list = tuple(tuple(v) for v in self.adjacency_list)
+        self.solution_path = tuple(self.solution_path)
+        self.next_in_solution = tuple(self.next_in_solution)
     
-    def get_neighbors(self, label):
+    def get_neighbors(self, idx):
         """Get all possible neighbors from current position"""
-        return self.adjacency_list.get(label, [])
+        return self.adjacency_list[idx]
     
     def set_solution_path(self, path):
         """Set the unique solution path for the puzzle"""
-        self.solution_path = path
+        self.solution_path = [self.label_to_idx[label] for label in path]
+        self.next_in_solution = [-1] * len(self.labels)
+        for i in range(len(path) - 1):
+            self.next_in_solution[self.solution_path[i]] = self.solution_path[i + 1]
+
+@lru_cache(maxsize=1)
+def create_fixed_puzzle():
+    """
+    Create a fixed 4x4 puzzle based on prototype images
+    The graph is frozen and holds no game state, so it is built once and
+    shared by every game
+    Grid layout (row, col):
+    A(↘) B(↘) C(↙) D(←)
+    E(↗) F(→) G(←) H(←)
+    I(→) J(↙) K(↖) L(↑)
+    M(→) N(→) O(→) P(★)
+
+    Solution path from Image 2 (visiting order):
+    1(A) → 2(K) → 3(F) → 4(H) → 5(G) → 6(E) → 7(B) → 8(L) 
+    → 9(D) → 10(C) → 11(I) → 12(J) → 13(M) → 14(N) → 15(O) → 16(P)
+    """
+    graph = PuzzleGraph()
+
+    # Define grid (label, row, col, arrow_direction)
+    grid_config = [
+        ('A', 0, 0, '↘'), ('B', 0, 1, '↘'), ('C', 0, 2, '↙'), ('D', 0, 3, '←'),
+        ('E', 1, 0, '↗'), ('F', 1, 1, '→'), ('G', 1, 2, '←'), ('H', 1, 3, '←'),
+        ('I', 2, 0, '→'), ('J', 2, 1, '↙'), ('K', 2, 2, '↖'), ('L', 2, 3, '↑'),
+        ('M', 3, 0, '→'), ('N', 3, 1, '→'), ('O', 3, 2, '→'), ('P', 3, 3, '★')
+    ]
+
+    # Add all nodes
+    for label, row, col, arrow in grid_config:
+        graph.add_node(label, row, col, arrow)
+
+    # Add edges based on arrow directions from Image 1
+    # Following the solution path to determine edges
+    edges = [
+        # From A(↙) - down-left diagonal
+        ('A', 'E'),  # A to E (down)
+        ('A', 'K'),  # A to K (diagonal down-right to reach position)
+
+        # From K(↗) - up-right diagonal  
+        ('K', 'G'),  # K to G (up)
+        ('K', 'F'),  # K to F (up-left diagonal)
+
+        # From F(→) - right
+        ('F', 'G'),  # F to G (right)
+        ('F', 'H'),  # F to H (following path)
+
+        # From H(←) - left
+        ('H', 'G'),  # H to G (left)
+
+        # From G(←) - left
+        ('G', 'F'),  # G to F (left)
+        ('G', 'E'),  # G to E (left-down)
+
+        # From E(↗) - up-right diagonal
+        ('E', 'B'),  # E to B (up)
+        ('E', 'A'),  # E to A (up)
+
+        # From B(↙) - down-left diagonal
+        ('B', 'F'),  # B to F (down)
+        ('B', 'L'),  # B to L (to continue path)
+
+        # From L(↑) - up
+        ('L', 'H'),  # L to H (up)
+        ('L', 'D'),  # L to D (up)
+
+        # From D(←) - left
+        ('D', 'C'),  # D to C (left)
+
+        # From C(↙) - down-left diagonal
+        ('C', 'G'),  # C to G (down)
+        ('C', 'I'),  # C to I (down-left to reach I)
+
+        # From I(→) - right
+        ('I', 'J'),  # I to J (right)
+
+        # From J(↙) - down-left diagonal
+        ('J', 'N'),  # J to N (down)
+        ('J', 'M'),  # J to M (down-left)
+
+        # From M(→) - right
+        ('M', 'N'),  # M to N (right)
+
+        # From N(→) - right
+        ('N', 'O'),  # N to O (right)
+
+        # From O(→) - right
+        ('O', 'P'),  # O to P (right - GOAL!)
+    ]
+
+    for from_node, to_node in edges:
+        graph.add_edge(from_node, to_node)
+
+    # Define the unique solution path from Image 2
+    # Following the number sequence: 1→2→3→4→5→6→7→8→9→10→11→12→13→14→15→16
+    solution = ['A', 'K', 'F', 'H', 'G', 'E', 'B', 'L', 'D', 'C', 'I', 'J', 'M', 'N', 'O', 'P']
+    graph.set_solution_path(solution)
+    graph.finalize()
+
+    return graph
 
 # ====================
 # GAME LOGIC
@@ -48,49 +192,48 @@ class PuzzleGraph:
 
 class GameState:
     """Manages the game state and rules"""
+    TURN_NAMES = ('Human', 'CPU')  # Indexed by self.turn
+    __slots__ = ('graph', 'current_position', 'turn', 'visit_count',
+                 'correct', 'illegal', 'visited_mask', 'visit_order',
+                 'game_over', 'winner')
+    
     def __init__(self, graph):
         self.graph = graph
-        self.current_position = 'A'  # Start at top-left
-        self.current_turn = 'Human'  # 'Human' or 'CPU'
+        self.current_position = graph.start  # Start at top-left
+        self.turn = 0  # 0 = Human, 1 = CPU
         self.visit_count = 0  # Tracks numbering for visited cells
         
-        # Counters for both players
-        self.human_correct_moves = 0
-        self.human_illegal_moves = 0
-        self.cpu_correct_moves = 0
-        self.cpu_illegal_moves = 0
+        # Counters for both players, indexed by turn
+        self.correct = [0, 0]
+        self.illegal = [0, 0]
         
         # Mark starting position as visited
-        self.graph.nodes['A'].visited = True
+        # Visited cells as a bitmask, one bit per cell idx
+        self.visited_mask = 1 << self.current_position
         self.visit_count = 1
-        self.graph.nodes['A'].visit_order = 1
+        self.visit_order = [0] * len(graph.labels)  # Will be 1, 2, 3... when visited, 0 before
+        self.visit_order[self.current_position] = 1
         
         self.game_over = False
         self.winner = None
         
-    def is_legal_move(self, target_label):
+    def is_legal_move(self, target):
         """Check if move is legal (follows arrow and unvisited)"""
         # Check if target is a valid neighbor
-        neighbors = self.graph.get_neighbors(self.current_position)
-        if target_label not in neighbors:
+        if target not in self.graph.adjacency_set[self.current_position]:
             return False
         
         # Check if target is unvisited
-        if self.graph.nodes[target_label].visited:
+        if (self.visited_mask >> target) & 1:
             return False
             
         return True
     
-    def is_correct_move(self, target_label):
+    def is_correct_move(self, target):
         """Check if move matches the solution path"""
-        try:
-            current_index = self.graph.solution_path.index(self.current_position)
-            next_in_solution = self.graph.solution_path[current_index + 1]
-            return target_label == next_in_solution
-        except (ValueError, IndexError):
-            return False
+        return self.graph.next_in_solution[self.current_position] == target
     
-    def make_move(self, target_label):
+    def make_move(self, target):
         """
         Attempt to make a move
         Returns: (success: bool, is_correct: bool)
@@ -98,33 +241,26 @@ class GameState:
         if self.game_over:
             return False, False
         
-        is_legal = self.is_legal_move(target_label)
-        is_correct = self.is_correct_move(target_label)
+        is_legal = self.is_legal_move(target)
+        is_correct = self.is_correct_move(target)
         
         # Illegal move: increment counter, switch turn
         if not is_legal or not is_correct:
-            if self.current_turn == 'Human':
-                self.human_illegal_moves += 1
-            else:
-                self.cpu_illegal_moves += 1
-            
+            self.illegal[self.turn] += 1
             self.switch_turn()
             return False, False
         
         # Legal and correct move: update position
         self.visit_count += 1
-        self.graph.nodes[target_label].visited = True
-        self.graph.nodes[target_label].visit_order = self.visit_count
-        self.current_position = target_label
+        self.visited_mask |= 1 << target
+        self.visit_order[target] = self.visit_count
+        self.current_position = target
         
         # Update correct move counter
-        if self.current_turn == 'Human':
-            self.human_correct_moves += 1
-        else:
-            self.cpu_correct_moves += 1
+        self.correct[self.turn] += 1
         
         # Check win condition (reached Grid 16 / label 'P')
-        if target_label == 'P':
+        if target == self.graph.goal:
             self.game_over = True
             self.determine_winner()
         
@@ -133,7 +269,28 @@ class GameState:
     
     def switch_turn(self):
         """Switch between Human and CPU turn"""
-        self.current_turn = 'CPU' if self.current_turn == 'Human' else 'Human'
+        self.turn ^= 1
+    
+    @property
+    def current_turn(self):
+        """'Human' or 'CPU'"""
+        return self.TURN_NAMES[self.turn]
+    
+    @property
+    def human_correct_moves(self):
+        return self.correct[0]
+    
+    @property
+    def human_illegal_moves(self):
+        return self.illegal[0]
+    
+    @property
+    def cpu_correct_moves(self):
+        return self.correct[1]
+    
+    @property
+    def cpu_illegal_moves(self):
+        return self.illegal[1]
     
     def determine_winner(self):
         """Determine winner based on illegal move count"""
@@ -148,19 +305,28 @@ class GameState:
 # CPU PLAYER (GREEDY)
 # ====================
 
+def _best_move_kernel(neighbors_by_distance, visited_mask):
+    """
+    Greedy move selection on plain ints: returns the neighbor idx closest
+    to the goal, or -1 if the cell has no neighbors
+    neighbors_by_distance must already be sorted closest to the goal first
+    """
+    # Greedy choice: the first unvisited neighbor is the closest legal one
+    for move in neighbors_by_distance:
+        if not (visited_mask >> move) & 1:
+            return move
+    
+    # If no legal moves, try any neighbor (will be illegal but game rule requires move)
+    return neighbors_by_distance[0] if neighbors_by_distance else -1
+
 class GreedyCPU:
     """CPU player using greedy strategy"""
+    __slots__ = ('graph', 'game_state', 'move_cache')
+    
     def __init__(self, graph, game_state):
         self.graph = graph
         self.game_state = game_state
-    
-    def calculate_distance_to_goal(self, label):
-        """Calculate Manhattan distance to goal (Grid 16 / label 'P')"""
-        node = self.graph.nodes[label]
-        goal_node = self.graph.nodes['P']
-        
-        distance = abs(node.row - goal_node.row) + abs(node.col - goal_node.col)
-        return distance
+        self.move_cache = {}  # Dictionary: (position, visited_mask) -> best move
     
     def get_best_move(self):
         """
@@ -168,22 +334,21 @@ class GreedyCPU:
         without making illegal moves if possible
         """
         current_pos = self.game_state.current_position
-        neighbors = self.graph.get_neighbors(current_pos)
         
-        # Filter legal moves (unvisited neighbors)
-        legal_moves = [n for n in neighbors if not self.graph.nodes[n].visited]
+        # The puzzle is fixed, so the greedy choice depends only on
+        # where we are and which cells are already visited
+        key = (current_pos, self.game_state.visited_mask)
+        if key in self.move_cache:
+            return self.move_cache[key]
         
-        # If no legal moves, try any neighbor (will be illegal but game rule requires move)
-        if not legal_moves:
-            legal_moves = neighbors if neighbors else []
+        best_move = _best_move_kernel(self.graph.neighbors_by_distance[current_pos],
+                                      self.game_state.visited_mask)
         
-        if not legal_moves:
+        if best_move < 0:
             # No moves possible, make a random illegal attempt
-            all_labels = list(self.graph.nodes.keys())
-            return random.choice(all_labels)
+            return random.randrange(len(self.graph.labels))
         
-        # Greedy choice: pick the neighbor closest to goal
-        best_move = min(legal_moves, key=lambda x: self.calculate_distance_to_goal(x))
+        self.move_cache[key] = best_move
         return best_move
 
 # ====================
@@ -197,109 +362,19 @@ class PuzzleGameGUI:
         self.root.title("Arrow Grid Puzzle - Human vs CPU")
         
         # Initialize graph with fixed puzzle
-        self.graph = self.create_fixed_puzzle()
+        self.graph = create_fixed_puzzle()
         self.game_state = GameState(self.graph)
         self.cpu_player = GreedyCPU(self.graph, self.game_state)
         
+        # CPU moves are computed on a worker thread so the mainloop never blocks
+        self.cpu_executor = ThreadPoolExecutor(max_workers=1)
+        self._cpu_future = None
+        
         # GUI components
-        self.buttons = {}  # Dictionary: label -> button widget
+        self.buttons = []  # List: idx -> button widget
         self.create_gui()
-        self.update_display()
-    
-    def create_fixed_puzzle(self):
-        """
-        Create a fixed 4x4 puzzle based on prototype images
-        Grid layout (row, col):
-        A(↘) B(↘) C(↙) D(←)
-        E(↗) F(→) G(←) H(←)
-        I(→) J(↙) K(↖) L(↑)
-        M(→) N(→) O(→) P(★)
-        
-        Solution path from Image 2 (visiting order):
-        1(A) → 2(K) → 3(F) → 4(H) → 5(G) → 6(E) → 7(B) → 8(L) 
-        → 9(D) → 10(C) → 11(I) → 12(J) → 13(M) → 14(N) → 15(O) → 16(P)
-        """
-        graph = PuzzleGraph()
-        
-        # Define grid (label, row, col, arrow_direction)
-        grid_config = [
-            ('A', 0, 0, '↘'), ('B', 0, 1, '↘'), ('C', 0, 2, '↙'), ('D', 0, 3, '←'),
-            ('E', 1, 0, '↗'), ('F', 1, 1, '→'), ('G', 1, 2, '←'), ('H', 1, 3, '←'),
-            ('I', 2, 0, '→'), ('J', 2, 1, '↙'), ('K', 2, 2, '↖'), ('L', 2, 3, '↑'),
-            ('M', 3, 0, '→'), ('N', 3, 1, '→'), ('O', 3, 2, '→'), ('P', 3, 3, '★')
-        ]
-        
-        # Add all nodes
-        for label, row, col, arrow in grid_config:
-            graph.add_node(label, row, col, arrow)
-        
-        # Add edges based on arrow directions from Image 1
-        # Following the solution path to determine edges
-        edges = [
-            # From A(↙) - down-left diagonal
-            ('A', 'E'),  # A to E (down)
-            ('A', 'K'),  # A to K (diagonal down-right to reach position)
-            
-            # From K(↗) - up-right diagonal  
-            ('K', 'G'),  # K to G (up)
-            ('K', 'F'),  # K to F (up-left diagonal)
-            
-            # From F(→) - right
-            ('F', 'G'),  # F to G (right)
-            ('F', 'H'),  # F to H (following path)
-            
-            # From H(←) - left
-            ('H', 'G'),  # H to G (left)
-            
-            # From G(←) - left
-            ('G', 'F'),  # G to F (left)
-            ('G', 'E'),  # G to E (left-down)
-            
-            # From E(↗) - up-right diagonal
-            ('E', 'B'),  # E to B (up)
-            ('E', 'A'),  # E to A (up)
-            
-            # From B(↙) - down-left diagonal
-            ('B', 'F'),  # B to F (down)
-            ('B', 'L'),  # B to L (to continue path)
-            
-            # From L(↑) - up
-            ('L', 'H'),  # L to H (up)
-            ('L', 'D'),  # L to D (up)
-            
-            # From D(←) - left
-            ('D', 'C'),  # D to C (left)
-            
-            # From C(↙) - down-left diagonal
-            ('C', 'G'),  # C to G (down)
-            ('C', 'I'),  # C to I (down-left to reach I)
-            
-            # From I(→) - right
-            ('I', 'J'),  # I to J (right)
-            
-            # From J(↙) - down-left diagonal
-            ('J', 'N'),  # J to N (down)
-            ('J', 'M'),  # J to M (down-left)
-            
-            # From M(→) - right
-            ('M', 'N'),  # M to N (right)
-            
-            # From N(→) - right
-            ('N', 'O'),  # N to O (right)
-            
-            # From O(→) - right
-            ('O', 'P'),  # O to P (right - GOAL!)
-        ]
-        
-        for from_node, to_node in edges:
-            graph.add_edge(from_node, to_node)
-        
-        # Define the unique solution path from Image 2
-        # Following the number sequence: 1→2→3→4→5→6→7→8→9→10→11→12→13→14→15→16
-        solution = ['A', 'K', 'F', 'H', 'G', 'E', 'B', 'L', 'D', 'C', 'I', 'J', 'M', 'N', 'O', 'P']
-        graph.set_solution_path(solution)
-        
-        return graph
+        self._prev_current = self.game_state.current_position  # Cell highlighted at last redraw
+        self.update_display(force=True)
     
     def create_gui(self):
         """Create the GUI layout"""
@@ -313,57 +388,78 @@ class PuzzleGameGUI:
         grid_frame.grid(row=1, column=0, columnspan=4, padx=20, pady=10)
         
         # Create 4x4 grid buttons
-        for label, node in self.graph.nodes.items():
-            btn = tk.Button(grid_frame, text=f"{label}\n{node.arrow_direction}",
+        # Button and info texts are bound to Tk variables, so redraws only
+        # need var.set() and Tk coalesces the repaints
+        g = self.graph
+        # Arrows never change and a cell's visit order is fixed once set,
+        # so each button text is formatted at most twice per game
+        self._initial_text = [f"{label}\n{g.arrows[idx]}" for idx, label in enumerate(g.labels)]
+        self._visited_text = [None] * len(g.labels)  # Filled when the cell is first shown visited
+        self.btn_text = [tk.StringVar(value=text)
+                         for text in self._initial_text]  # List: idx -> button text
+        for idx, label in enumerate(g.labels):
+            btn = tk.Button(grid_frame, textvariable=self.btn_text[idx],
                           width=8, height=4, font=('Arial', 12),
-                          command=lambda l=label: self.on_cell_click(l))
-            btn.grid(row=node.row, column=node.col, padx=2, pady=2)
-            self.buttons[label] = btn
+                          command=lambda i=idx: self.on_cell_click(i))
+            btn.grid(row=g.rows[idx], column=g.cols[idx], padx=2, pady=2)
+            self.buttons.append(btn)
         
         # Info panel
         info_frame = tk.Frame(self.root)
         info_frame.grid(row=2, column=0, columnspan=4, pady=10)
         
         # Turn indicator
-        self.turn_label = tk.Label(info_frame, text="Current Turn: Human",
+        self.turn_var = tk.StringVar(value="Current Turn: Human")
+        self.turn_label = tk.Label(info_frame, textvariable=self.turn_var,
                                    font=('Arial', 12, 'bold'))
         self.turn_label.grid(row=0, column=0, columnspan=2, pady=5)
         
         # Counters
         tk.Label(info_frame, text="Human Stats:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky='w')
-        self.human_correct_label = tk.Label(info_frame, text="Correct: 0")
+        self.human_correct_var = tk.StringVar(value="Correct: 0")
+        self.human_correct_label = tk.Label(info_frame, textvariable=self.human_correct_var)
         self.human_correct_label.grid(row=2, column=0, sticky='w')
-        self.human_illegal_label = tk.Label(info_frame, text="Illegal: 0")
+        self.human_illegal_var = tk.StringVar(value="Illegal: 0")
+        self.human_illegal_label = tk.Label(info_frame, textvariable=self.human_illegal_var)
         self.human_illegal_label.grid(row=3, column=0, sticky='w')
         
         tk.Label(info_frame, text="CPU Stats:", font=('Arial', 10, 'bold')).grid(row=1, column=1, sticky='w', padx=20)
-        self.cpu_correct_label = tk.Label(info_frame, text="Correct: 0")
+        self.cpu_correct_var = tk.StringVar(value="Correct: 0")
+        self.cpu_correct_label = tk.Label(info_frame, textvariable=self.cpu_correct_var)
         self.cpu_correct_label.grid(row=2, column=1, sticky='w', padx=20)
-        self.cpu_illegal_label = tk.Label(info_frame, text="Illegal: 0")
+        self.cpu_illegal_var = tk.StringVar(value="Illegal: 0")
+        self.cpu_illegal_label = tk.Label(info_frame, textvariable=self.cpu_illegal_var)
         self.cpu_illegal_label.grid(row=3, column=1, sticky='w', padx=20)
         
         # Current position indicator
-        self.position_label = tk.Label(info_frame, text="Current Position: A (Grid 1)",
+        self.position_var = tk.StringVar(value="Current Position: A (Grid 1)")
+        self.position_label = tk.Label(info_frame, textvariable=self.position_var,
                                       font=('Arial', 10))
         self.position_label.grid(row=4, column=0, columnspan=2, pady=5)
+        
+        # Status line for turn warnings and illegal moves
+        self.status_label = tk.Label(info_frame, text="", fg='red',
+                                    font=('Arial', 10))
+        self.status_label.grid(row=5, column=0, columnspan=2, pady=5)
     
-    def on_cell_click(self, label):
+    def on_cell_click(self, idx):
         """Handle human player's cell click"""
         if self.game_state.game_over:
             return
         
         if self.game_state.current_turn != 'Human':
-            messagebox.showwarning("Not Your Turn", "Wait for CPU's turn to finish!")
+            self.status_label.config(text="Wait for CPU's turn to finish!")
             return
         
         # Attempt move
-        success, is_correct = self.game_state.make_move(label)
+        success, is_correct = self.game_state.make_move(idx)
         
         self.update_display()
         
-        if not success:
-            messagebox.showinfo("Illegal Move", 
-                              f"Move to {label} is illegal!\nIllegal move count increased.")
+        if success:
+            self.status_label.config(text="")
+        else:
+            self.status_label.config(text=f"Illegal move → {self.graph.labels[idx]}")
         
         # Check if game ended
         if self.game_state.game_over:
@@ -372,15 +468,25 @@ class PuzzleGameGUI:
         
         # CPU's turn
         if self.game_state.current_turn == 'CPU':
-            self.root.after(1000, self.cpu_turn)  # 1 second delay for CPU
+            self.cpu_turn()
     
     def cpu_turn(self):
-        """Execute CPU's turn"""
+        """Start CPU's turn: compute the greedy move off the Tk thread"""
         if self.game_state.game_over:
             return
         
+        self._cpu_future = self.cpu_executor.submit(self.cpu_player.get_best_move)
+        self.root.after(50, self._check_cpu_future)
+    
+    def _check_cpu_future(self):
+        """Poll the CPU worker and play its move on the Tk thread once ready"""
+        if not self._cpu_future.done():
+            self.root.after(50, self._check_cpu_future)
+            return
+        
         # Get CPU's move using greedy strategy
-        cpu_move = self.cpu_player.get_best_move()
+        cpu_move = self._cpu_future.result()
+        self._cpu_future = None
         
         # Make the move
         success, is_correct = self.game_state.make_move(cpu_move)
@@ -389,46 +495,51 @@ class PuzzleGameGUI:
         
         # Show CPU's move result
         if not success:
-            messagebox.showinfo("CPU Move", 
-                              f"CPU attempted illegal move to {cpu_move}!")
+            self.status_label.config(text=f"CPU illegal move → {self.graph.labels[cpu_move]}")
         
         # Check if game ended
         if self.game_state.game_over:
             self.show_winner()
     
-    def update_display(self):
-        """Update all GUI elements"""
+    def update_display(self, force=False):
+        """
+        Update all GUI elements
+        Only the previous and current cell can change between moves, so the
+        grid is fully repainted only when force is set (at startup)
+        """
         # Update grid buttons
-        for label, node in self.graph.nodes.items():
-            btn = self.buttons[label]
-            
-            # Update text to show visit order
-            if node.visited and node.visit_order:
-                btn.config(text=f"{node.visit_order}\n{node.arrow_direction}")
-            else:
-                btn.config(text=f"{label}\n{node.arrow_direction}")
-            
-            # Highlight current position
-            if label == self.game_state.current_position:
-                btn.config(bg='yellow')
-            elif node.visited:
-                btn.config(bg='lightgreen')
+        g = self.graph
+        visit_order = self.game_state.visit_order
+        current = self.game_state.current_position
+        cells = range(len(self.buttons)) if force else {self._prev_current, current}
+        for idx in cells:
+            # Text shows visit order, background highlights current position
+            if visit_order[idx]:
+                text = self._visited_text[idx]
+                if text is None:
+                    text = self._visited_text[idx] = f"{visit_order[idx]}\n{g.arrows[idx]}"
+                bg = 'yellow' if idx == current else 'lightgreen'
             else:
-                btn.config(bg='SystemButtonFace')
+                text, bg = self._initial_text[idx], 'SystemButtonFace'
+            self.btn_text[idx].set(text)
+            self.buttons[idx].config(bg=bg)
+        self._prev_current = current
         
         # Update turn indicator
-        self.turn_label.config(text=f"Current Turn: {self.game_state.current_turn}")
+        self.turn_var.set(f"Current Turn: {self.game_state.current_turn}")
         
         # Update counters
-        self.human_correct_label.config(text=f"Correct: {self.game_state.human_correct_moves}")
-        self.human_illegal_label.config(text=f"Illegal: {self.game_state.human_illegal_moves}")
-        self.cpu_correct_label.config(text=f"Correct: {self.game_state.cpu_correct_moves}")
-        self.cpu_illegal_label.config(text=f"Illegal: {self.game_state.cpu_illegal_moves}")
+        self.human_correct_var.set(f"Correct: {self.game_state.human_correct_moves}")
+        self.human_illegal_var.set(f"Illegal: {self.game_state.human_illegal_moves}")
+        self.cpu_correct_var.set(f"Correct: {self.game_state.cpu_correct_moves}")
+        self.cpu_illegal_var.set(f"Illegal: {self.game_state.cpu_illegal_moves}")
         
         # Update position
-        current_node = self.graph.nodes[self.game_state.current_position]
-        order = current_node.visit_order if current_node.visit_order else 0
-        self.position_label.config(text=f"Current Position: {self.game_state.current_position} (Grid {order})")
+        self.position_var.set(f"Current Position: {g.labels[current]} (Grid {visit_order[current]})")
+        
+        # Flush the pending redraws in one pass (draw only, no event
+        # processing) so the board is current before any Game Over dialog
+        self.root.update_idletasks()
     
     def show_winner(self):
         """Display winner message"""
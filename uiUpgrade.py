@@ -1,42 +1,90 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
+from functools import partial
 
 # ====================
 # GRAPH IMPLEMENTATION
 # ====================
 
-class GraphNode:
-    """Represents a single grid cell in the puzzle"""
-    def __init__(self, label, row, col, arrow_direction):
-        self.label = label
-        self.row = row
-        self.col = col
-        self.arrow_direction = arrow_direction
-        self.visited = False
-        self.visit_order = None
-
-
 class PuzzleGraph:
-    """Graph representation using adjacency list"""
+    """
+    Graph over cells 0..N-1 stored as parallel arrays (one entry per cell)
+    instead of one object per cell. Labels are only needed at the GUI
+    boundary, through labels / label_to_idx.
+
+    The graph holds only the static puzzle and is frozen by finalize();
+    everything that changes during a game lives in GameState.
+    """
     def __init__(self):
-        self.nodes = {}
-        self.adjacency_list = {}
+        self.labels = []          # idx -> 'A', 'B', ...
+        self.label_to_idx = {}    # 'A', 'B', ... -> idx
+        self.row = []
+        self.col = []
+        self.arrow = []
+        self.neighbor_mask = []   # idx -> bit j set if idx -> j is an edge
         self.solution_path = []
+        self.next_in_solution = []   # idx -> next idx on the path, -1 at the end
 
     def add_node(self, label, row, col, arrow_direction):
-        self.nodes[label] = GraphNode(label, row, col, arrow_direction)
-        self.adjacency_list[label] = []
+        self.label_to_idx[label] = len(self.labels)
+        self.labels.append(label)
+        self.row.append(row)
+        self.col.append(col)
+        self.arrow.append(arrow_direction)
+        self.neighbor_mask.append(0)
 
     def add_edge(self, from_label, to_label):
-        if from_label in self.adjacency_list:
-            self.adjacency_list[from_label].append(to_label)
-
-    def get_neighbors(self, label):
-        return self.adjacency_list.get(label, [])
+        if from_label in self.label_to_idx:
+            self.neighbor_mask[self.label_to_idx[from_label]] |= 1 << self.label_to_idx[to_label]
 
     def set_solution_path(self, path):
-        self.solution_path = path
+        self.solution_path = [self.label_to_idx[label] for label in path]
+        self.next_in_solution = [-1] * len(self.labels)
+        for cur, nxt in zip(self.solution_path, self.solution_path[1:]):
+            self.next_in_solution[cur] = nxt
+
+    def finalize(self):
+        """Called once all nodes, edges and the solution path are set"""
+        self.goal = self.label_to_idx['P']
+        gr, gc = self.row[self.goal], self.col[self.goal]
+        self.dist_to_goal = tuple(
+            abs(r - gr) + abs(c - gc) for r, c in zip(self.row, self.col)
+        )
+        for name in ('labels', 'row', 'col', 'arrow', 'neighbor_mask',
+                     'solution_path', 'next_in_solution'):
+            setattr(self, name, tuple(getattr(self, name)))
+
+
+def create_fixed_puzzle():
+    graph = PuzzleGraph()
+    grid = [
+        ('A',0,0,'↘'),('B',0,1,'↘'),('C',0,2,'↙'),('D',0,3,'←'),
+        ('E',1,0,'↗'),('F',1,1,'→'),('G',1,2,'←'),('H',1,3,'←'),
+        ('I',2,0,'→'),('J',2,1,'↙'),('K',2,2,'↖'),('L',2,3,'↑'),
+        ('M',3,0,'→'),('N',3,1,'→'),('O',3,2,'→'),('P',3,3,'★')
+    ]
+    for l,r,c,a in grid:
+        graph.add_node(l,r,c,a)
+
+    edges = [
+        ('A','E'),('A','K'),('K','G'),('K','F'),('F','G'),('F','H'),
+        ('H','G'),('G','F'),('G','E'),('E','B'),('E','A'),('B','F'),
+        ('B','L'),('L','H'),('L','D'),('D','C'),('C','G'),('C','I'),
+        ('I','J'),('J','N'),('J','M'),('M','N'),('N','O'),('O','P')
+    ]
+    for u,v in edges:
+        graph.add_edge(u,v)
+
+    graph.set_solution_path(
+        ['A','K','F','H','G','E','B','L','D','C','I','J','M','N','O','P']
+    )
+    graph.finalize()
+    return graph
+
+
+# The puzzle never changes, so it is built once and shared by every game
+FIXED_PUZZLE = create_fixed_puzzle()
 
 
 # ====================
@@ -46,7 +94,7 @@ class PuzzleGraph:
 class GameState:
     def __init__(self, graph):
         self.graph = graph
-        self.current_position = 'A'
+        self.current_position = graph.label_to_idx['A']
         self.current_turn = 'Human'
         self.visit_count = 1
 
@@ -55,32 +103,28 @@ class GameState:
         self.cpu_correct_moves = 0
         self.cpu_illegal_moves = 0
 
-        self.cpu_illegal_history = set()
+        # Per source cell, bit j set once the CPU has tried source -> j illegally
+        self.cpu_illegal_history = [0] * len(graph.labels)
 
-        self.graph.nodes['A'].visited = True
-        self.graph.nodes['A'].visit_order = 1
+        self.visited_mask = 1 << self.current_position
+        self.visit_order = [0] * len(graph.labels)   # 0 until the cell is visited
+        self.visit_order[self.current_position] = 1
 
         self.game_over = False
         self.winner = None
 
     def is_legal_move(self, target):
-        if target not in self.graph.get_neighbors(self.current_position):
-            return False
-        if self.graph.nodes[target].visited:
-            return False
-        return True
+        open_mask = self.graph.neighbor_mask[self.current_position] & ~self.visited_mask
+        return bool((open_mask >> target) & 1)
 
     def is_correct_move(self, target):
-        try:
-            idx = self.graph.solution_path.index(self.current_position)
-            return self.graph.solution_path[idx + 1] == target
-        except:
-            return False
+        return self.graph.next_in_solution[self.current_position] == target
 
     def make_move(self, target):
         if self.game_over:
             return False, False
 
+        cur = self.current_position
         legal = self.is_legal_move(target)
         correct = self.is_correct_move(target)
 
@@ -89,15 +133,14 @@ class GameState:
                 self.human_illegal_moves += 1
             else:
                 self.cpu_illegal_moves += 1
-                self.cpu_illegal_history.add((self.current_position, target))
+                self.cpu_illegal_history[cur] |= 1 << target
 
             self.switch_turn()
             return False, False
 
         self.visit_count += 1
-        node = self.graph.nodes[target]
-        node.visited = True
-        node.visit_order = self.visit_count
+        self.visited_mask |= 1 << target
+        self.visit_order[target] = self.visit_count
         self.current_position = target
 
         if self.current_turn == 'Human':
@@ -105,7 +148,7 @@ class GameState:
         else:
             self.cpu_correct_moves += 1
 
-        if target == 'P':
+        if target == self.graph.goal:
             self.game_over = True
             self.determine_winner()
 
@@ -128,35 +171,65 @@ class GameState:
 # CPU PLAYER
 # ====================
 
+def _best_move_kernel(neighbors, visited_mask, history, dist_to_goal):
+    """
+    Pick the neighbor closest to the goal, preferring unvisited cells the
+    CPU has not already tried from here. Works on ints only; returns -1 if
+    the cell has no neighbors at all.
+    """
+    fallback = neighbors & ~visited_mask
+    candidates = (fallback & ~history) or fallback or neighbors
+
+    # Walk the set bits lowest first, keeping the closest cell to the goal
+    best, best_dist = -1, len(dist_to_goal)
+    while candidates:
+        low = candidates & -candidates
+        candidates ^= low
+        target = low.bit_length() - 1
+        if dist_to_goal[target] < best_dist:
+            best, best_dist = target, dist_to_goal[target]
+    return best
+
+
 class GreedyCPU:
     def __init__(self, graph, game_state):
         self.graph = graph
         self.game_state = game_state
 
-    def distance_to_goal(self, label):
-        node = self.graph.nodes[label]
-        goal = self.graph.nodes['P']
-        return abs(node.row - goal.row) + abs(node.col - goal.col)
-
     def get_best_move(self):
         current = self.game_state.current_position
-        neighbors = self.graph.get_neighbors(current)
-        history = self.game_state.cpu_illegal_history
+        move = _best_move_kernel(
+            self.graph.neighbor_mask[current],
+            self.game_state.visited_mask,
+            self.game_state.cpu_illegal_history[current],
+            self.graph.dist_to_goal
+        )
 
-        primary = [
-            n for n in neighbors
-            if not self.graph.nodes[n].visited
-            and (current, n) not in history
-        ]
+        if move < 0:
+            return random.randrange(len(self.graph.labels))
 
-        fallback = [n for n in neighbors if not self.graph.nodes[n].visited]
+        return move
 
-        candidates = primary or fallback or neighbors
 
-        if not candidates:
-            return random.choice(list(self.graph.nodes.keys()))
+# ====================
+# HEADLESS
+# ====================
 
-        return min(candidates, key=self.distance_to_goal)
+def run_headless(n_games=1, max_moves=1000):
+    """
+    Play n_games CPU-vs-CPU games without Tk, for benchmarking the game
+    logic. Returns the winner of each game (None if max_moves ran out).
+    """
+    winners = []
+    for _ in range(n_games):
+        state = GameState(FIXED_PUZZLE)
+        cpu = GreedyCPU(FIXED_PUZZLE, state)
+        for _ in range(max_moves):
+            if state.game_over:
+                break
+            state.make_move(cpu.get_best_move())
+        winners.append(state.winner)
+    return winners
 
 
 # ====================
@@ -164,42 +237,26 @@ class GreedyCPU:
 # ====================
 
 class PuzzleGameGUI:
-    def __init__(self, root):
+    def __init__(self, root, interactive=True):
         self.root = root
         self.root.title("Arrow Grid Puzzle - Human vs CPU")
 
-        self.graph = self.create_fixed_puzzle()
+        # Pause before the CPU answers so a human can follow the game;
+        # scripted runs skip it
+        self.cpu_delay_ms = 800 if interactive else 0
+
+        self.graph = FIXED_PUZZLE
         self.game_state = GameState(self.graph)
         self.cpu_player = GreedyCPU(self.graph, self.game_state)
 
-        self.buttons = {}
+        self.buttons = []     # idx -> button widget
         self.create_gui()
-        self.update_display()
 
-    def create_fixed_puzzle(self):
-        graph = PuzzleGraph()
-        grid = [
-            ('A',0,0,'↘'),('B',0,1,'↘'),('C',0,2,'↙'),('D',0,3,'←'),
-            ('E',1,0,'↗'),('F',1,1,'→'),('G',1,2,'←'),('H',1,3,'←'),
-            ('I',2,0,'→'),('J',2,1,'↙'),('K',2,2,'↖'),('L',2,3,'↑'),
-            ('M',3,0,'→'),('N',3,1,'→'),('O',3,2,'→'),('P',3,3,'★')
-        ]
-        for l,r,c,a in grid:
-            graph.add_node(l,r,c,a)
-
-        edges = [
-            ('A','E'),('A','K'),('K','G'),('K','F'),('F','G'),('F','H'),
-            ('H','G'),('G','F'),('G','E'),('E','B'),('E','A'),('B','F'),
-            ('B','L'),('L','H'),('L','D'),('D','C'),('C','G'),('C','I'),
-            ('I','J'),('J','N'),('J','M'),('M','N'),('N','O'),('O','P')
-        ]
-        for u,v in edges:
-            graph.add_edge(u,v)
-
-        graph.set_solution_path(
-            ['A','K','F','H','G','E','B','L','D','C','I','J','M','N','O','P']
-        )
-        return graph
+        # Only cells listed in _dirty are redrawn; _shown holds the
+        # (text, bg) last sent to each button so unchanged cells are skipped
+        self._dirty = set(range(len(self.buttons)))
+        self._shown = [None] * len(self.buttons)
+        self.update_display()
 
     def create_gui(self):
     # ===== Root container (centers everything) =====
@@ -227,17 +284,24 @@ class PuzzleGameGUI:
         )
         grid_frame.grid(row=0, column=0, padx=15, pady=5)
 
-        for label, node in self.graph.nodes.items():
+        g = self.graph
+        n = len(g.labels)
+        # _text_cache[idx][visit_order] is the button text, label when 0
+        self._text_cache = tuple(
+            tuple(f"{order or label}\n{arrow}" for order in range(n + 1))
+            for label, arrow in zip(g.labels, g.arrow)
+        )
+        for idx, label in enumerate(g.labels):
             btn = tk.Button(
                 grid_frame,
-                text=f"{label}\n{node.arrow_direction}",
+                text=self._text_cache[idx][0],
                 width=8,
                 height=4,
                 font=('Arial', 12),
-                command=lambda l=label: self.on_cell_click(l)
+                command=partial(self.on_cell_click, idx)
             )
-            btn.grid(row=node.row, column=node.col, padx=3, pady=3)
-            self.buttons[label] = btn
+            btn.grid(row=g.row[idx], column=g.col[idx], padx=3, pady=3)
+            self.buttons.append(btn)
 
         # ===== RIGHT: Side Panel =====
         side_frame = tk.Frame(main_frame)
@@ -299,40 +363,51 @@ class PuzzleGameGUI:
         self.history.config(state="disabled")
         self.history.see(tk.END)
 
-    def flash_illegal(self, label):
-        self.buttons[label].config(bg="red")
-        self.root.after(800, self.update_display)
+    def flash_illegal(self, idx):
+        self.buttons[idx].config(bg="red")
+        self._shown[idx] = None
+        self.root.after(800, self.end_flash, idx)
+
+    def end_flash(self, idx):
+        self._dirty.add(idx)
+        self.update_display()
 
-    def on_cell_click(self, label):
+    def on_cell_click(self, idx):
         if self.game_state.current_turn != 'Human' or self.game_state.game_over:
             return
 
-        success,_ = self.game_state.make_move(label)
+        prev = self.game_state.current_position
+        success,_ = self.game_state.make_move(idx)
+        label = self.graph.labels[idx]
 
         if success:
+            self._dirty.update((prev, idx))
             self.log(f"Human → {label}", "legal")
         else:
             self.log(f"Human illegal → {label}", "illegal")
-            self.flash_illegal(label)
+            self.flash_illegal(idx)
 
         self.update_display()
 
         if self.game_state.game_over:
             self.show_winner()
         else:
-            self.root.after(800, self.cpu_turn)
+            self.root.after(self.cpu_delay_ms, self.cpu_turn)
 
     def cpu_turn(self):
         if self.game_state.game_over:
             return
 
+        prev = self.game_state.current_position
         move = self.cpu_player.get_best_move()
         success,_ = self.game_state.make_move(move)
+        label = self.graph.labels[move]
 
         if success:
-            self.log(f"CPU → {move}", "legal")
+            self._dirty.update((prev, move))
+            self.log(f"CPU → {label}", "legal")
         else:
-            self.log(f"CPU illegal → {move}", "illegal")
+            self.log(f"CPU illegal → {label}", "illegal")
             self.flash_illegal(move)
 
         self.update_display()
@@ -341,26 +416,35 @@ class PuzzleGameGUI:
             self.show_winner()
 
     def update_display(self):
-        for label,node in self.graph.nodes.items():
-            btn = self.buttons[label]
-            if node.visited:
-                btn.config(text=f"{node.visit_order}\n{node.arrow_direction}", bg="lightgreen")
+        state = self.game_state
+        labels = self.graph.labels
+        buttons, shown, text_cache = self.buttons, self._shown, self._text_cache
+        visited = state.visited_mask
+        visit_order = state.visit_order
+        cur = state.current_position
+        for idx in self._dirty:
+            text = text_cache[idx][visit_order[idx]]
+            if idx == cur:
+                bg = "yellow"
+            elif (visited >> idx) & 1:
+                bg = "lightgreen"
             else:
-                btn.config(text=f"{label}\n{node.arrow_direction}", bg="SystemButtonFace")
-            if label == self.game_state.current_position:
-                btn.config(bg="yellow")
+                bg = "SystemButtonFace"
+            if shown[idx] != (text, bg):
+                buttons[idx].config(text=text, bg=bg)
+                shown[idx] = (text, bg)
+        self._dirty.clear()
 
-        self.turn_label.config(text=f"Current Turn: {self.game_state.current_turn}")
+        self.turn_label.config(text=f"Current Turn: {state.current_turn}")
         self.human_stats.config(
-            text=f"Human\nCorrect: {self.game_state.human_correct_moves}\nIllegal: {self.game_state.human_illegal_moves}"
+            text=f"Human\nCorrect: {state.human_correct_moves}\nIllegal: {state.human_illegal_moves}"
         )
         self.cpu_stats.config(
-            text=f"CPU\nCorrect: {self.game_state.cpu_correct_moves}\nIllegal: {self.game_state.cpu_illegal_moves}"
+            text=f"CPU\nCorrect: {state.cpu_correct_moves}\nIllegal: {state.cpu_illegal_moves}"
         )
 
-        order = self.graph.nodes[self.game_state.current_position].visit_order
         self.position_label.config(
-            text=f"Current Position: {self.game_state.current_position} (Grid {order})"
+            text=f"Current Position: {labels[cur]} (Grid {visit_order[cur]})"
         )
 
     def show_winner(self):